@@ -49,10 +49,11 @@ html_escape_table = {
     '"': "&quot;",
     "'": "&apos;"
     }
+html_escape_trans = str.maketrans(html_escape_table)
 
 def html_escape(text):
     """Produce entities within text."""
-    return "".join(html_escape_table.get(c,c) for c in text)
+    return text.translate(html_escape_trans)
 
 
 # ## Creating the markdown files
@@ -62,11 +63,26 @@ def html_escape(text):
 # In[5]:
 
 import os
-for row, item in publications.iterrows():
+
+def write_if_changed(path, text):
+    """Write text to path, leaving the file untouched if it already matches."""
+    if os.path.isfile(path):
+        with open(path, 'r') as f:
+            if f.read() == text:
+                return False
+    with open(path + ".tmp", 'w') as f:
+        f.write(text)
+    os.replace(path + ".tmp", path)
+    return True
+
+for item in publications.itertuples(index=False):
     
-    md_filename = str(item.pub_date) + "-" + item.url_slug + ".md"
     html_filename = str(item.pub_date) + "-" + item.url_slug
+    md_filename = html_filename + ".md"
     year = item.pub_date[:4]
+    has_excerpt = len(str(item.excerpt)) > 5
+    has_paper_url = len(str(item.paper_url)) > 5
+    excerpt = html_escape(item.excerpt) if has_excerpt else ""
     
     ## YAML variables
     
@@ -76,14 +92,14 @@ for row, item in publications.iterrows():
     
     md += """\npermalink: /publication/""" + html_filename
     
-    if len(str(item.excerpt)) > 5:
-        md += "\nexcerpt: '" + html_escape(item.excerpt) + "'"
+    if has_excerpt:
+        md += "\nexcerpt: '" + excerpt + "'"
     
     md += "\ndate: " + str(item.pub_date) 
     
     md += "\nvenue: '" + html_escape(item.venue) + "'"
     
-    if len(str(item.paper_url)) > 5:
+    if has_paper_url:
         md += "\npaperurl: '" + item.paper_url + "'"
     
     md += "\ncitation: '" + html_escape(item.citation) + "'"
@@ -92,17 +108,16 @@ for row, item in publications.iterrows():
     
     ## Markdown description for individual page
     
-    if len(str(item.paper_url)) > 5:
+    if has_paper_url:
         md += "\n\n<a href='" + item.paper_url + "'>Download paper here</a>\n" 
         
-    if len(str(item.excerpt)) > 5:
-        md += "\n" + html_escape(item.excerpt) + "\n"
+    if has_excerpt:
+        md += "\n" + excerpt + "\n"
         
     md += "\nRecommended citation: " + item.citation
     
     md_filename = os.path.basename(md_filename)
        
-    with open("../_publications/" + md_filename, 'w') as f:
-        f.write(md)
+    write_if_changed("../_publications/" + md_filename, md)
 
 
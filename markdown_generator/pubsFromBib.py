@@ -18,7 +18,6 @@
 
 from pybtex.database.input import bibtex
 import pybtex.database.input.bibtex 
-from time import strptime
 import string
 import html
 import os
@@ -43,21 +42,49 @@ publist = {
     } 
 }
 
+#characters dropped from titles when building url slugs
+url_slug_pattern = re.compile("\\[.*\\]|[^a-zA-Z0-9_-]")
+
+#two-digit month numbers keyed by lowercase three-letter abbreviation
+month_numbers = {name: "{:02d}".format(number) for number, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+
+#bibtex formatting characters stripped from titles and venues
+bibtex_markup_trans = str.maketrans("", "", "{}\\")
+
 html_escape_table = {
     "&": "&amp;",
     '"': "&quot;",
     "'": "&apos;"
     }
+html_escape_trans = str.maketrans(html_escape_table)
 
 def html_escape(text):
     """Produce entities within text."""
-    return "".join(html_escape_table.get(c,c) for c in text)
+    return text.translate(html_escape_trans)
+
+def write_if_changed(path, text):
+    """Write text to path, leaving the file untouched if it already matches."""
+    if os.path.isfile(path):
+        with open(path, 'r', encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    with open(path + ".tmp", 'w', encoding="utf-8") as f:
+        f.write(text)
+    os.replace(path + ".tmp", path)
+    return True
 
 
 for pubsource in publist:
     parser = bibtex.Parser()
     bibdata = parser.parse_file(publist[pubsource]["file"])
 
+    #per-source settings shared by every entry in this bibtex file
+    venue_pretext = publist[pubsource]["venue-pretext"]
+    venue_key = publist[pubsource]["venuekey"]
+    collection_header = ("collection: " + publist[pubsource]["collection"]["name"]
+                         + "\npermalink: " + publist[pubsource]["collection"]["permalink"])
+
     #loop through the individual references in a given bibtex file
     for bib_id in bibdata.entries:
         #reset default date
@@ -76,8 +103,7 @@ for pubsource in publist:
                     pub_month = "0"+b["month"]
                     pub_month = pub_month[-2:]
                 elif(b["month"] not in range(12)):
-                    tmnth = strptime(b["month"][:3],'%b').tm_mon   
-                    pub_month = "{:02d}".format(tmnth) 
+                    pub_month = month_numbers[b["month"][:3].lower()]
                 else:
                     pub_month = str(b["month"])
             if "day" in b.keys(): 
@@ -87,37 +113,35 @@ for pubsource in publist:
             pub_date = pub_year+"-"+pub_month+"-"+pub_day
             
             #strip out {} as needed (some bibtex entries that maintain formatting)
-            clean_title = b["title"].replace("{", "").replace("}","").replace("\\","").replace(" ","-")    
+            plain_title = b["title"].translate(bibtex_markup_trans)
+            escaped_title = html_escape(plain_title)
+            clean_title = plain_title.replace(" ","-")
 
-            url_slug = re.sub("\\[.*\\]|[^a-zA-Z0-9_-]", "", clean_title)
+            url_slug = url_slug_pattern.sub("", clean_title)
             url_slug = url_slug.replace("--","-")
 
             md_filename = (str(pub_date) + "-" + url_slug + ".md").replace("--","-")
             html_filename = (str(pub_date) + "-" + url_slug).replace("--","-")
 
             #Build Citation from text
-            citation = ""
-
             #citation authors - todo - add highlighting for primary author?
-            for author in bibdata.entries[bib_id].persons["author"]:
-                citation = citation+" "+author.first_names[0]+" "+author.last_names[0]+", "
+            citation = "".join(" "+author.first_names[0]+" "+author.last_names[0]+", "
+                               for author in bibdata.entries[bib_id].persons["author"])
 
             #citation title
-            citation = citation + "\"" + html_escape(b["title"].replace("{", "").replace("}","").replace("\\","")) + ".\""
+            citation = citation + "\"" + escaped_title + ".\""
 
             #add venue logic depending on citation type
-            venue = publist[pubsource]["venue-pretext"]+b[publist[pubsource]["venuekey"]].replace("{", "").replace("}","").replace("\\","")
+            venue = venue_pretext+b[venue_key].translate(bibtex_markup_trans)
 
             citation = citation + " " + html_escape(venue)
             citation = citation + ", " + pub_year + "."
 
             
             ## YAML variables
-            md = "---\ntitle: \""   + html_escape(b["title"].replace("{", "").replace("}","").replace("\\","")) + '"\n'
+            md = "---\ntitle: \""   + escaped_title + '"\n'
             
-            md += """collection: """ +  publist[pubsource]["collection"]["name"]
-
-            md += """\npermalink: """ + publist[pubsource]["collection"]["permalink"]  + html_filename
+            md += collection_header + html_filename
             
             note = False
             if "note" in b.keys():
@@ -151,8 +175,7 @@ for pubsource in publist:
 
             md_filename = os.path.basename(md_filename)
 
-            with open("../_publications/" + md_filename, 'w', encoding="utf-8") as f:
-                f.write(md)
+            write_if_changed("../_publications/" + md_filename, md)
             print(f'SUCESSFULLY PARSED {bib_id}: \"', b["title"][:60],"..."*(len(b['title'])>60),"\"")
         # field may not exist for a reference
         except KeyError as e:
@@ -48,13 +48,25 @@ html_escape_table = {
     '"': "&quot;",
     "'": "&apos;"
     }
+html_escape_trans = str.maketrans(html_escape_table)
 
 def html_escape(text):
     if type(text) is str:
-        return "".join(html_escape_table.get(c,c) for c in text)
+        return text.translate(html_escape_trans)
     else:
         return "False"
 
+def write_if_changed(path, text):
+    """Write text to path, leaving the file untouched if it already matches."""
+    if os.path.isfile(path):
+        with open(path, 'r') as f:
+            if f.read() == text:
+                return False
+    with open(path + ".tmp", 'w') as f:
+        f.write(text)
+    os.replace(path + ".tmp", path)
+    return True
+
 
 # ## Creating the markdown files
 # 
@@ -64,10 +76,10 @@ def html_escape(text):
 
 loc_dict = {}
 
-for row, item in talks.iterrows():
+for item in talks.itertuples(index=False):
     
-    md_filename = str(item.date) + "-" + item.url_slug + ".md"
-    html_filename = str(item.date) + "-" + item.url_slug 
+    html_filename = str(item.date) + "-" + item.url_slug
+    md_filename = html_filename + ".md"
     year = item.date[:4]
     
     md = "---\ntitle: \""   + item.title + '"\n'
@@ -85,8 +97,6 @@ for row, item in talks.iterrows():
         
     if len(str(item.location)) > 3:
         md += "date: " + str(item.date) + "\n"
-    
-    if len(str(item.location)) > 3:
         md += 'location: "' + str(item.location) + '"\n'
            
     md += "---\n"
@@ -103,8 +113,7 @@ for row, item in talks.iterrows():
     md_filename = os.path.basename(md_filename)
     #print(md)
     
-    with open("../_talks/" + md_filename, 'w') as f:
-        f.write(md)
+    write_if_changed("../_talks/" + md_filename, md)
 
 
 # These files are in the talks directory, one directory below where we're working from.
@@ -7,40 +7,70 @@
 # Run this from the _talks/ directory, which contains .md files of all your talks. 
 # This scrapes the location YAML field from each .md file, geolocates it with
 # geopy/Nominatim, and uses the getorg library to output data, HTML,
-# and Javascript for a standalone cluster map.
+# and Javascript for a standalone cluster map. Geocoding results are cached in
+# ../.geocache.db so that reruns only query Nominatim for new locations.
 #
-# Requires: glob, getorg, geopy
+# Requires: getorg, geopy
 
-import glob
+import os
+import sqlite3
 import getorg
 from geopy import Nominatim
+from geopy.extra.rate_limiter import RateLimiter
+from geopy.location import Location
 
-g = glob.glob("*.md")
+g = [entry.name for entry in os.scandir(".")
+     if entry.name.endswith(".md") and not entry.name.startswith(".")
+     and entry.is_file()]
 
 
 geocoder = Nominatim()
+# Nominatim allows at most one request per second, so misses are spaced out
+# rather than fired concurrently; cache hits never wait.
+rate_limited_geocode = RateLimiter(geocoder.geocode, min_delay_seconds=1)
 location_dict = {}
 location = ""
 permalink = ""
 title = ""
 
+geocache = sqlite3.connect("../.geocache.db")
+geocache.execute("CREATE TABLE IF NOT EXISTS geocache "
+                 "(location TEXT PRIMARY KEY, address TEXT, latitude REAL, longitude REAL)")
+
+
+def geocode(location):
+    """Geocode a location, reusing and recording results in the sqlite cache."""
+    row = geocache.execute("SELECT address, latitude, longitude FROM geocache WHERE location = ?",
+                           (location,)).fetchone()
+    if row is not None:
+        return Location(row[0], (row[1], row[2]), {})
+    result = rate_limited_geocode(location)
+    if result is not None:
+        with geocache:
+            geocache.execute("INSERT OR REPLACE INTO geocache VALUES (?, ?, ?, ?)",
+                             (location, result.address, result.latitude, result.longitude))
+    return result
+
 
 for file in g:
     with open(file, 'r') as f:
-        lines = f.read()
-        if lines.find('location: "') > 1:
-            loc_start = lines.find('location: "') + 11
-            lines_trim = lines[loc_start:]
-            loc_end = lines_trim.find('"')
-            location = lines_trim[:loc_end]
-                            
-           
-        location_dict[location] = geocoder.geocode(location)
+        # Only the front matter is needed, so stop at its closing "---"
+        # instead of reading the whole talk.
+        for line_number, line in enumerate(f):
+            if line.startswith('location: "'):
+                location = line[11:line.find('"', 11)]
+                break
+            if line_number > 0 and line.rstrip() == "---":
+                break
+
+        if location not in location_dict:
+            location_dict[location] = geocode(location)
         print(location, "\n", location_dict[location])
 
 
 m = getorg.orgmap.create_map_obj()
 getorg.orgmap.output_html_cluster_map(location_dict, folder_name="../talkmap", hashed_usernames=False)
+geocache.close()
 
 
 